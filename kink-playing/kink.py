@@ -9,6 +9,8 @@
     notify:       https://lazka.github.io/pgi-docs/#Notify-0.7
     appindicator: https://lazka.github.io/pgi-docs/#AyatanaAppIndicator3-0.1
     requests:     https://requests.readthedocs.io/en/latest
+    orjson:       https://github.com/ijl/orjson (optional)
+    ujson:        https://github.com/ultrajson/ultrajson (optional)
     vlc:          https://www.olivieraubert.net/vlc/python-ctypes/doc/
     Author:       Arjen Balfoort, 08-05-2023
 """
@@ -16,24 +18,34 @@
 import gettext
 import os
 import subprocess
-import json
 from enum import Enum
+from html import escape
 from shutil import copyfile
 from pathlib import Path
 from configparser import ConfigParser
 from os.path import abspath, dirname, join, exists
 from threading import Event, Thread
+from queue import Queue
+from time import monotonic
 try:
-    from .utils import open_text_file, str_int
+    from .utils import open_text_file, str_int, json_str
 except ImportError:
-    from utils import open_text_file, str_int
+    from utils import open_text_file, str_int, json_str
 
-import vlc
-import requests
+# Use the faster orjson or ujson parser when available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+# vlc and requests are imported when first used
 import gi
 gi.require_version('Gtk', '3.0')
 gi.require_version('Notify', '0.7')
-from gi.repository import Gtk, Notify
+from gi.repository import Gtk, GLib, Notify
 try:
     gi.require_version('AyatanaAppIndicator3', '0.1')
     from gi.repository import AyatanaAppIndicator3 as AppIndicator3
@@ -44,6 +56,10 @@ except ValueError:
 APP_ID = 'kink-playing'
 APP_NAME = 'ꓘINK Playing'
 _ = gettext.translation(APP_ID, fallback=True).gettext
+# Seconds to keep the list of stations before reading it again
+STATIONS_TTL = 300
+# Maximum seconds to wait for a response from KINK
+MAX_HTTP_TIMEOUT = 5
 
 class DefaultSettings(Enum):
     """ Enum with default settings.ini values """
@@ -67,6 +83,10 @@ class MenuIcons(Enum):
 
 class KinkPlaying():
     """ Connect to Kink player on network and show info in system tray. """
+    # Notification body templates
+    _TITLE_TMPL = f"<b>{_('Title')}</b>: {{title}}"
+    _BODY_TMPL = f"<b>{_('Artist')}</b>: {{artist}}\n{_TITLE_TMPL}"
+
     def __init__(self):
         # Initiate variables
         scriptdir = abspath(dirname(__file__))
@@ -77,9 +97,17 @@ class KinkPlaying():
         self.settings = join(local_dir, 'settings.ini')
         self.tmp_thumb = join(local_dir, 'album_art.jpg')
         self.grey_icon = join(scriptdir, f"{APP_ID}-grey.svg")
-        self.instance = vlc.Instance('--intf dummy')
-        self.list_player = self.instance.media_list_player_new()
+        # VLC is loaded when the radio is played for the first time
+        self.instance = None
+        self.list_player = None
+        # Play or pause requested by the user
+        self._playing = False
         self.station = None
+        # Connection state of the last json request: used to build the menu
+        self._connected = False
+        # Stations from the json data: filled by the poll thread
+        self._stations_cache = []
+        self._stations_fetched_at = 0.0
         self.cur_playing = {'station': '', 'program': '',
                             'artist': '','title': '', 'album_art': ''}
         # Use dict to negate the mutability of self.cur_playing
@@ -89,6 +117,14 @@ class KinkPlaying():
         # lines starting with ";" are not comments, but they are keys without a value.
         # Set comment_prefixes to a string which you will not use in the config file
         self.conf_parser = ConfigParser(comment_prefixes='/', allow_no_value=True)
+        # Modification time of settings.ini when it was last read
+        self._settings_mtime = None
+        # Validators and data of the last json download: reset when the json url changes
+        self.json = None
+        self._etag = None
+        self._last_mod = None
+        self._last_json = None
+        self._json_fetched_at = 0.0
 
         # Create local directory
         os.makedirs(local_dir, exist_ok=True)
@@ -116,8 +152,22 @@ class KinkPlaying():
             if exists(autostart_dt):
                 os.remove(autostart_dt)
 
+        # One session (keep-alive) for all requests to KINK: see _get_session
+        self.session = None
+        # Url and ETag of the saved album art
+        # Only _save_thumb changes the file: no need to check if it exists
+        self._thumb_exists = exists(self.tmp_thumb)
+        self._last_thumb_url = None
+        self._thumb_etag = None
+
         # Create event to use when thread is done
         self.check_done_event = Event()
+        # Create event to wake the thread for an immediate check
+        self._wake = Event()
+        # New songs found by the poll thread
+        self._events = Queue()
+        # Seconds to wait for the next check
+        self._backoff = self.wait
         # Create global indicator object
         self.indicator = AppIndicator3.Indicator.new(APP_ID,
                                                      APP_ID,
@@ -126,82 +176,166 @@ class KinkPlaying():
         self.indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
         self.indicator.set_menu(self._build_menu())
 
-        # Init notifier
+        # Init notifier and reuse a single notification
         Notify.init(APP_NAME)
+        self._notification = Notify.Notification.new('', None, None)
+        self._notification.set_urgency(Notify.Urgency.LOW)
+        self._notification_timeout = None
 
-        # Reset log
-        if exists(self.playlist):
-            os.remove(self.playlist)
+        # Reset log and keep it open (line buffered) while running
+        self._playlist_fle = open(file=self.playlist, mode='w', encoding='utf-8', buffering=1)
 
-        # Load the configured playlist
-        self._add_playlist()
+        # Load the configured playlist and play
         if self.autoplay == 1:
             self.play_kink()
-        else:
-            self.pause_kink()
 
         # Start thread to check for connection changes
+        # The thread does the (blocking) network requests and hands all
+        # menu, icon and notification updates to the GTK main loop
         Thread(target=self._run_check).start()
+        # Start thread to handle new songs: album art downloads don't delay the next check
+        Thread(target=self._notify_worker).start()
 
     def _run_check(self):
         """ Poll Kink for currently playing song. """
         was_connected = True
+        # The menu is built disabled until the first successful check
+        menu_connected = self._connected
 
-        while not self.check_done_event.is_set():
-            # Check if kink server is online
-            if not self._is_connected():
-                # Show lost connection message
-                if was_connected:
-                    self.indicator.set_menu(self._build_menu())
-                    self.indicator.set_icon_full(self.grey_icon, '')
-                    unable_string = _('Unable to connect to:')
-                    self.show_notification(summary=f"{unable_string} {self.station}",
-                                           thumb=APP_ID)
-                    was_connected = False
-            else:
-                # In case we had lost our connection
-                if not was_connected:
-                    # Build menu and show normal icon
-                    self.indicator.set_menu(self._build_menu())
-                    self.indicator.set_icon_full(APP_ID, '')
-                    was_connected = True
-
-                # Check if there is new playing data
-                self._fill_cur_playing()
-                if self.cur_playing != self.prev_playing:
+        # Bind the methods used in every loop to locals
+        is_done = self.check_done_event.is_set
+        wake_wait = self._wake.wait
+        wake_clear = self._wake.clear
+        fill_cur_playing = self._fill_cur_playing
+        on_main = self._on_main
+        put_event = self._events.put
+
+        try:
+            while not is_done():
+                # Wake requests up to here are handled by this check
+                wake_clear()
+
+                # Get playing data: this also tells us if the kink server is online
+                connected = fill_cur_playing()
+                if is_done():
+                    # Quit while waiting for KINK
+                    break
+                # Enable or disable the menu items when the menu doesn't match the connection
+                if connected != menu_connected:
+                    on_main(self._update_sensitivity)
+                    menu_connected = connected
+                if not connected:
+                    # Show lost connection message
+                    if was_connected:
+                        on_main(self.indicator.set_icon_full, self.grey_icon, '')
+                        unable_string = _('Unable to connect to:')
+                        on_main(self.show_notification,
+                                f"{unable_string} {self.station}", None, APP_ID)
+                        was_connected = False
+                        self._backoff = self.wait
+                    else:
+                        # Still offline: check less and less often
+                        self._backoff = min(self._backoff * 2, max(self.wait, 60))
+                else:
+                    # In case we had lost our connection
+                    if not was_connected:
+                        # Show normal icon
+                        on_main(self.indicator.set_icon_full, APP_ID, '')
+                        was_connected = True
+                        self._backoff = self.wait
+
+                    # Check if there is new playing data
+                    if not self._playing:
+                        # Nobody is listening: only keep checking the connection
+                        self._backoff = self._max_wait()
+                    elif self.cur_playing == self.prev_playing:
+                        # Nothing changed: check less often
+                        self._backoff = min(self._backoff * 1.5, self._max_wait())
+                    else:
+                        self._backoff = self.wait
+                        # Let the notify thread handle the new song
+                        put_event(dict(self.cur_playing))
+
+                        # Save playing data for the next loop
+                        self.prev_playing = dict(self.cur_playing)
+
+                # Wait until we continue with the loop
+                wake_wait(self._backoff)
+        finally:
+            # Done (or failed): stop the notify thread when it handled all songs
+            put_event(None)
+
+    def _notify_worker(self):
+        """ Log new songs from the poll thread, get their album art and notify. """
+        while True:
+            playing = self._events.get()
+            if playing is None:
+                break
+
+            # One bad song should not stop the notifications for the next songs
+            try:
+                # No need for album art and notification when quitting
+                if not self.check_done_event.is_set():
                     # Get album art
-                    self._save_thumb(self.cur_playing['album_art'])
+                    self._save_thumb(playing['album_art'])
 
                     # Send notification
-                    self.show_song_info()
+                    self._on_main(self.show_song_info, playing)
+
+                # Keep a simple log
+                song = f"{playing['station']}: {playing['artist']} - {playing['title']}"
+                print((song))
+                self._playlist_fle.write(f"{song}\n")
+            except Exception as err:
+                print((f"Unable to handle song: {err}"))
+
+        # Done: close the log
+        self._playlist_fle.close()
 
-                    # Keep a simple log
-                    playing = (f"{self.station}: "
-                               f"{self.cur_playing['artist']} - {self.cur_playing['title']}")
-                    print((playing))
-                    with open(file=self.playlist, mode='a', encoding='utf-8') as log:
-                        log.write(f"{playing}\n")
+    def _max_wait(self):
+        """Get the longest wait between checks while KINK is online.
 
-                    # Save playing data for the next loop
-                    self.prev_playing = dict(self.cur_playing)
+        Returns:
+            int: seconds
+        """
+        return 4 * self.wait
 
-            # Wait until we continue with the loop
-            self.check_done_event.wait(self.wait)
+    def _on_main(self, function, *args):
+        """Call function from the GTK main loop: GTK is not thread safe.
+
+        Args:
+            function (obj): function to call
+            *args: function arguments
+        """
+        def _call():
+            function(*args)
+            # Call only once
+            return False
+        GLib.idle_add(_call)
 
     # ===============================================
     # Kink functions
     # ===============================================
 
-    def show_song_info(self):
-        """ Show song information in notification. """
-        if self.cur_playing and self.notification_timeout > 0:
-            # Show notification
-            artist = _('Artist')
-            title = _('Title')
-            self.show_notification(summary=f"{self.station}: {self.cur_playing['program']}",
-                                    body=(f"<b>{artist}</b>: {self.cur_playing['artist']}\n"
-                                            f"<b>{title}</b>: {self.cur_playing['title']}"),
-                                    thumb=self.tmp_thumb)
+    def show_song_info(self, playing=None, thumb=None):
+        """Show song information in notification.
+
+        Args:
+            playing (dict, optional): playing data. Defaults to self.cur_playing.
+            thumb (str, optional): notification icon. Defaults to the saved album art.
+        """
+        playing = playing or self.cur_playing
+        if not thumb:
+            thumb = self.tmp_thumb if self._thumb_exists else APP_ID
+        if playing and self.notification_timeout > 0:
+            # Show notification: skip the artist row if there is no artist
+            # The body is markup: escape & < and > only, quotes don't need it
+            artist = escape(playing['artist'], quote=False)
+            title = escape(playing['title'], quote=False)
+            body_tmpl = self._BODY_TMPL if artist else self._TITLE_TMPL
+            self.show_notification(summary=f"{playing['station']}: {playing['program']}",
+                                    body=body_tmpl.format(artist=artist, title=title),
+                                    thumb=thumb)
 
     def _save_thumb(self, url):
         """Retrieve image data from url and save to path
@@ -210,24 +344,99 @@ class KinkPlaying():
             url (str): image url
         """
         if not url:
-            if exists(self.tmp_thumb):
+            if self._thumb_exists:
                 os.remove(self.tmp_thumb)
+                self._thumb_exists = False
+            self._last_thumb_url = None
+            self._thumb_etag = None
             return
-        res = requests.get(url, timeout=self.wait)
-        if res.status_code == 200:
-            with open(file=self.tmp_thumb, mode='wb') as file:
-                file.write(res.content)
+        # Still have the image of the previous song
+        if url == self._last_thumb_url:
+            return
+        # A reused image (e.g. the show art) has the same ETag on a new url
+        # Last-Modified says nothing about the saved image: don't send it
+        headers = {}
+        if self._thumb_exists and self._thumb_etag:
+            headers['If-None-Match'] = self._thumb_etag
+        import requests
+        # Download to a separate file first: never leave a partial image behind
+        part_thumb = f"{self.tmp_thumb}.part"
+        try:
+            with self._get_session().get(url, headers=headers,
+                                         stream=True, timeout=self._http_timeout) as res:
+                if res.status_code == 304:
+                    self._last_thumb_url = url
+                elif res.status_code == 200:
+                    with open(file=part_thumb, mode='wb') as file:
+                        for chunk in res.iter_content(8192):
+                            file.write(chunk)
+                    os.replace(part_thumb, self.tmp_thumb)
+                    self._thumb_exists = True
+                    self._last_thumb_url = url
+                    self._thumb_etag = res.headers.get('ETag')
+        except (requests.RequestException, OSError) as err:
+            print((f"Unable to save album art: {err}"))
+            # Don't leave a partial image behind
+            if exists(part_thumb):
+                os.remove(part_thumb)
+
+    def _get_session(self):
+        """Get the session for all requests to KINK.
+           Only used by the poll and notify threads: requests is imported there.
+
+        Returns:
+            requests.Session: keep-alive session
+        """
+        if self.session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            session = requests.Session()
+            session.headers['Connection'] = 'keep-alive'
+            session.headers['User-Agent'] = APP_ID
+            # Pool for the json and album art hosts, retry failed connects only:
+            # a read timeout is not retried and stays bound to the timeout
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                  max_retries=Retry(connect=2, read=0, backoff_factor=0.2))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self.session = session
+        return self.session
 
     def _json_request(self):
         """Get json data from KINK.
 
         Returns:
-            json: now playing data from KINK
+            json: now playing data from KINK or None when KINK is offline
         """
-        res = requests.get(self.json, timeout=self.wait)
-        if res.status_code == 200:
-            return json.loads(res.text)
-        return None
+        # The data of all stations is still fresh: e.g. right after a station switch
+        if self._last_json is not None and monotonic() - self._json_fetched_at < self.wait / 2:
+            return self._last_json
+
+        import requests
+        # Only download the data when it changed since the last request
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_mod:
+            headers['If-Modified-Since'] = self._last_mod
+        obj = None
+        try:
+            res = self._get_session().get(self.json, headers=headers,
+                                          timeout=self._http_timeout)
+            if res.status_code == 304:
+                obj = self._last_json
+                self._json_fetched_at = monotonic()
+            elif res.status_code == 200:
+                self._last_json = json_loads(res.content)
+                self._etag = res.headers.get('ETag')
+                self._last_mod = res.headers.get('Last-Modified')
+                self._json_fetched_at = monotonic()
+                obj = self._last_json
+        except (requests.RequestException, ValueError):
+            pass
+        self._connected = obj is not None
+        return obj
 
     def get_stations(self):
         """Get lists of Kink stations
@@ -235,18 +444,32 @@ class KinkPlaying():
         Returns:
             list: list with available KINK stations
         """
-        obj = self._json_request()
-        if obj:
-            s_dict = obj['stations']
-        else:
-            return []
-        stations = list(s_dict.keys())
-        stations.sort()
+        return self._stations_cache
+
+    def _cache_stations(self, obj):
+        """Save the KINK stations from the json data and update the menu when changed.
+
+        Args:
+            obj (json): now playing data from KINK
+        """
+        # Stations rarely change
+        if self._stations_cache and monotonic() - self._stations_fetched_at < STATIONS_TTL:
+            return
+        try:
+            stations = sorted(obj['stations'])
+        except (KeyError, TypeError):
+            return
 
         # kink-indie is not used
-        stations.remove('kink-indie')
+        if 'kink-indie' in stations:
+            stations.remove('kink-indie')
+        self._stations_fetched_at = monotonic()
 
-        return stations
+        if stations != self._stations_cache:
+            self._stations_cache = stations
+            self._map_streams()
+            self._on_main(self._build_stations_menu)
+            self._on_main(self._update_sensitivity)
 
     def switch_station(self, station):
         """Switch KINK station.
@@ -259,57 +482,38 @@ class KinkPlaying():
         self.station = station
         print((f"Switch station: {self.station}"))
 
-        was_playing = False
-        if self.list_player.is_playing():
-            self.stop_kink()
-            was_playing = True
-        self._add_playlist()
-        if was_playing:
-            self.play_kink()
+        # Without player the playlist is loaded when played
+        if self.list_player is not None:
+            was_playing = self._playing
+            if was_playing:
+                self.stop_kink()
+            self._add_playlist()
+            if was_playing:
+                self.play_kink()
 
-        self.indicator.set_menu(self._build_menu())
+        self._update_station_check()
+        # Get playing data of the new station right away
+        self._wake.set()
 
     def _fill_cur_playing(self):
-        """Get what's playing data from Kink."""
-        obj = self._json_request()
-        program = ''
-        artist = ''
-        title = ''
-        album_art = ''
-        if obj:
-            try:
-                artist = obj['extended'][self.station]['artist']
-            except Exception:
-                pass
-            try:
-                title = obj['extended'][self.station]['title']
-            except Exception:
-                pass
-            try:
-                album_art = obj['extended'][self.station]['album_art']['320']
-            except Exception:
-                pass
-            try:
-                program = obj['extended'][self.station]['program']['title']
-            except Exception:
-                pass
-
-        self.cur_playing['station'] = self.station
-        self.cur_playing['program'] = program
-        self.cur_playing['artist'] = artist
-        self.cur_playing['title'] = title
-        self.cur_playing['album_art'] = album_art
-
-    def _is_connected(self):
-        """Check if Kink is online.
+        """Get what's playing data from Kink.
 
         Returns:
             bool: able to connect to KINK or not
         """
-        res = requests.get(self.json, timeout=self.wait)
-        if res.status_code == 200:
-            return True
-        return False
+        obj = self._json_request()
+        if obj is None:
+            return False
+        self._cache_stations(obj)
+        # Missing, null or unexpected values are saved as empty strings
+        ext = obj.get('extended') if isinstance(obj, dict) else None
+        ext = ext.get(self.station) if isinstance(ext, dict) else None
+        self.cur_playing['station'] = self.station
+        self.cur_playing['program'] = json_str(ext, 'program', 'title')
+        self.cur_playing['artist'] = json_str(ext, 'artist')
+        self.cur_playing['title'] = json_str(ext, 'title')
+        self.cur_playing['album_art'] = json_str(ext, 'album_art', '320')
+        return True
 
     def _get_pls(self):
         """Get the station playlist url
@@ -317,11 +521,20 @@ class KinkPlaying():
         Returns:
             str: play list url for current station
         """
-        if 'dna' in self.station:
-            return self.streams['dna']
-        if 'distortion' in self.station:
-            return self.streams['distortion']
-        return self.streams['kink']
+        return self._station_to_pls.get(self.station, self.streams['kink'])
+
+    def _map_streams(self):
+        """ Map the known stations to their play list url. """
+        # Fill a new dict: the GTK main loop may use the current one
+        station_to_pls = {}
+        for station in self._stations_cache or [self.station]:
+            if 'dna' in station:
+                station_to_pls[station] = self.streams['dna']
+            elif 'distortion' in station:
+                station_to_pls[station] = self.streams['distortion']
+            else:
+                station_to_pls[station] = self.streams['kink']
+        self._station_to_pls = station_to_pls
 
     def _add_playlist(self):
         """ Add playlist to VLC """
@@ -331,19 +544,37 @@ class KinkPlaying():
         media_list.add_media(url)
         self.list_player.set_media_list(media_list)
 
+    def _load_player(self):
+        """ Load VLC and the playlist of the current station on first use. """
+        if self.list_player is None:
+            import vlc
+            self.instance = vlc.Instance('--intf dummy')
+            self.list_player = self.instance.media_list_player_new()
+            self._add_playlist()
+
     def play_kink(self):
         """ Play playlist """
+        self._load_player()
         self.list_player.play()
-        self.indicator.set_menu(self._build_menu())
+        self._playing = True
+        self._update_play_pause(playing=True)
+        self._backoff = self.wait
+        self._wake.set()
 
     def pause_kink(self):
         """ Pause playlist """
-        self.list_player.pause()
-        self.indicator.set_menu(self._build_menu())
+        if self.list_player is not None:
+            # pause() toggles: make sure the player is paused like the menu says
+            self.list_player.set_pause(1)
+        self._playing = False
+        self._update_play_pause(playing=False)
+        self._backoff = self._max_wait()
 
     def stop_kink(self):
         """ Stop playlist """
-        self.list_player.stop()
+        if self.list_player is not None:
+            self.list_player.stop()
+        self._playing = False
 
     # ===============================================
     # System Tray Icon
@@ -396,6 +627,7 @@ class KinkPlaying():
 
     def _build_menu(self):
         """Build menu for the tray icon.
+           The menu is built once: use the _update functions to change it.
 
         Returns:
             Gtk.Menu: indicator menu
@@ -418,38 +650,23 @@ class KinkPlaying():
 
         # Stations
         menu.append(Gtk.SeparatorMenuItem())
-        item_stations = Gtk.MenuItem.new_with_label(_('Stations'))
-        stations = self.get_stations()
-        if stations:
-            sub_menu = Gtk.Menu()
-            for station in stations:
-                select_icon = ""
-                if station == self.station:
-                    select_icon = MenuIcons.SELECT.value
-                sub_menu.append(self._menu_item(label=station,
-                                                icon=select_icon,
-                                                function=self.switch_station,
-                                                argument=station))
-            item_stations.set_submenu(sub_menu)
-        menu.append(item_stations)
+        self._item_stations = Gtk.MenuItem.new_with_label(_('Stations'))
+        self._build_stations_menu()
+        menu.append(self._item_stations)
 
         # Now playing menu
         menu.append(Gtk.SeparatorMenuItem())
-        item_now_playing = self._menu_item(label=_('Now playing'),
-                                           function=self.show_current)
-        menu.append(item_now_playing)
+        self._item_now_playing = self._menu_item(label=_('Now playing'),
+                                                 function=self.show_current)
+        menu.append(self._item_now_playing)
 
         # Play/pause menu
         menu.append(Gtk.SeparatorMenuItem())
-        if self.list_player.is_playing():
-            item_play_pause = self._menu_item(label=_('Pause'),
-                                              icon=MenuIcons.PAUSE.value,
-                                              function=self.play_pause)
-        else:
-            item_play_pause = self._menu_item(label=_('Play'),
-                                              icon=MenuIcons.PLAY.value,
-                                              function=self.play_pause)
-        menu.append(item_play_pause)
+        # Nothing plays yet: play_kink changes it to pause
+        self._item_play_pause = self._menu_item(label=_('Play'),
+                                                icon=MenuIcons.PLAY.value,
+                                                function=self.play_pause)
+        menu.append(self._item_play_pause)
 
         # Quit menu
         menu.append(Gtk.SeparatorMenuItem())
@@ -457,21 +674,74 @@ class KinkPlaying():
                                     function=self.quit))
 
         # Decide what can be used
-        item_now_playing.set_sensitive(True)
-        item_stations.set_sensitive(True)
-        item_play_pause.set_sensitive(True)
-        if not self._is_connected():
-            item_now_playing.set_sensitive(False)
-            item_stations.set_sensitive(False)
-            item_play_pause.set_sensitive(False)
+        self._update_sensitivity()
 
         # Show the menu and return the menu object
         menu.show_all()
         return menu
 
+    def _build_stations_menu(self):
+        """ Build the stations sub menu. """
+        self._station_items = {}
+        stations = self.get_stations()
+        if not stations:
+            self._item_stations.set_submenu(None)
+            return
+        sub_menu = Gtk.Menu()
+        for station in stations:
+            select_icon = ""
+            if station == self.station:
+                select_icon = MenuIcons.SELECT.value
+            item = self._menu_item(label=station,
+                                   icon=select_icon,
+                                   function=self.switch_station,
+                                   argument=station)
+            self._station_items[station] = item
+            sub_menu.append(item)
+        sub_menu.show_all()
+        self._item_stations.set_submenu(sub_menu)
+
+    def _update_play_pause(self, playing):
+        """Show play or pause in the play/pause menu item.
+
+        Args:
+            playing (bool): radio is playing
+        """
+        img, label = self._item_play_pause.get_child().get_children()
+        if playing:
+            img.set_from_icon_name(MenuIcons.PAUSE.value, Gtk.IconSize.MENU)
+            label.set_label(_('Pause'))
+        else:
+            img.set_from_icon_name(MenuIcons.PLAY.value, Gtk.IconSize.MENU)
+            label.set_label(_('Play'))
+
+    def _update_station_check(self):
+        """ Show the select icon in front of the current station only. """
+        for station, item in self._station_items.items():
+            item_box = item.get_child()
+            images = [w for w in item_box.get_children() if isinstance(w, Gtk.Image)]
+            if station == self.station:
+                if not images:
+                    img = self._get_image(icon=MenuIcons.SELECT.value)
+                    item_box.pack_start(img, False, False, 0)
+                    item_box.reorder_child(img, 0)
+                    img.show()
+            else:
+                for img in images:
+                    item_box.remove(img)
+
+    def _update_sensitivity(self):
+        """ Disable the menu items that need a connection when offline. """
+        self._item_now_playing.set_sensitive(self._connected)
+        self._item_stations.set_sensitive(self._connected)
+        self._item_play_pause.set_sensitive(self._connected)
+
     def show_current(self, widget=None):
         """ Show last played song. """
-        self.show_song_info()
+        playing = dict(self.cur_playing)
+        # While paused the album art is not fetched: don't show the art of another song
+        thumb = None if playing['album_art'] == self._last_thumb_url else APP_ID
+        self.show_song_info(playing, thumb)
 
     def show_site(self, widget=None):
         """ Show site in default browser """
@@ -483,7 +753,7 @@ class KinkPlaying():
 
     def play_pause(self, widget=None):
         """ Play or pause Kink radio """
-        if self.list_player.is_playing():
+        if self._playing:
             self.pause_kink()
         else:
             self.play_kink()
@@ -492,7 +762,23 @@ class KinkPlaying():
         """ Open settings.ini in default editor. """
         if exists(self.settings):
             open_text_file(self.settings)
-            self.read_config()
+            # Only read the settings again when the file was changed
+            if os.stat(self.settings).st_mtime_ns != self._settings_mtime:
+                station = self.station
+                self.read_config()
+                # The station is None when the settings are read for the first time
+                if station is not None and self.station != station:
+                    # Load the new station like switch_station does
+                    if self.list_player is not None:
+                        was_playing = self._playing
+                        if was_playing:
+                            self.stop_kink()
+                        self._add_playlist()
+                        if was_playing:
+                            self.play_kink()
+                    self._update_station_check()
+                    # Get playing data of the new station right away
+                    self._wake.set()
 
     # ===============================================
     # General functions
@@ -501,13 +787,17 @@ class KinkPlaying():
     def quit(self, widget=None):
         """ Quit the application. """
         self.check_done_event.set()
+        self._wake.set()
+        # Close the idle connections right away
+        if self.session is not None:
+            self.session.close()
         self.stop_kink()
         self.save_station()
         Notify.uninit()
         Gtk.main_quit()
 
     def _check_conf_key(self, key):
-        """Check key in settings.ini and append to file if missing.
+        """Check key in settings.ini and remember the default value if missing.
 
         Args:
             key (str): settings key.
@@ -519,28 +809,51 @@ class KinkPlaying():
             value = self.kink_dict['kink'][key]
         except KeyError:
             value = DefaultSettings[key.upper()].value
-            with open(file=self.settings, mode='a', encoding='utf-8') as conf:
-                conf.write(f"\n{key} = {value}\n")
+            self._pending_writes[key] = value
         return value
 
     def read_config(self):
         """ Read settings.ini, save in dictionary and check some variables. """
+        self._pending_writes = {}
         self.conf_parser.read(self.settings)
         self.kink_dict = {s:dict(self.conf_parser.items(s)) for s in self.conf_parser.sections()}
         self.site = self._check_conf_key('site')
         self.streams = {'kink': self._check_conf_key('stream_kink'),
                         'dna': self._check_conf_key('stream_dna'),
                         'distortion': self._check_conf_key('stream_distortion')}
-        self.json = self._check_conf_key('json')
+        json_url = self._check_conf_key('json')
+        if json_url != self.json:
+            # Validators and data of the old url don't apply to the new url
+            self._etag = None
+            self._last_mod = None
+            self._last_json = None
+            self._json_fetched_at = 0.0
+            self.json = json_url
         self.station = self._check_conf_key('station')
         self.wait = str_int(self._check_conf_key('wait'))
         self.wait = max(self.wait, 1)
+        # Don't let a slow server block the threads (and quit) for too long
+        self._http_timeout = min(self.wait, MAX_HTTP_TIMEOUT)
         self.notification_timeout = str_int(self._check_conf_key('show_notification'))
         self.autostart = str_int(self._check_conf_key('autostart'))
         self.autoplay = str_int(self._check_conf_key('autoplay'))
+        self._map_streams()
+
+        # Save missing keys to settings.ini in one go
+        if self._pending_writes:
+            if 'kink' not in self.conf_parser.sections():
+                self.conf_parser.add_section('kink')
+            for key, value in self._pending_writes.items():
+                self.conf_parser.set('kink', key, value)
+            with open(file=self.settings, mode='w', encoding='utf-8') as conf:
+                self.conf_parser.write(conf)
+        self._settings_mtime = os.stat(self.settings).st_mtime_ns
 
     def save_station(self):
         ''' Save station to the config file '''
+        # Nothing to save when the station did not change
+        if self.conf_parser.get('kink', 'station', fallback=None) == self.station:
+            return
         if 'kink' not in self.conf_parser.sections():
             self.conf_parser.add_section('kink')
         self.conf_parser.set('kink', 'station', self.station)
@@ -555,7 +868,9 @@ class KinkPlaying():
             body (str, optional): notification body text. Defaults to None.
             thumb (str, optional): icon path. Defaults to None.
         """
-        notification = Notify.Notification.new(summary, body, thumb)
-        notification.set_timeout(self.notification_timeout * 1000)
-        notification.set_urgency(Notify.Urgency.LOW)
-        notification.show()
+        # Timeout can change in settings.ini
+        if self._notification_timeout != self.notification_timeout:
+            self._notification.set_timeout(self.notification_timeout * 1000)
+            self._notification_timeout = self.notification_timeout
+        self._notification.update(summary, body, thumb)
+        self._notification.show()
@@ -45,3 +45,13 @@ def str_int(nr_str, default_int=0):
         return int(nr_str)
     except ValueError:
         return default_int
+
+def json_str(node, *keys):
+    """ Walk nested json dictionaries and return the value as string or empty string. """
+    for key in keys:
+        if not isinstance(node, dict):
+            return ''
+        node = node.get(key)
+    if node is None or isinstance(node, (dict, list)):
+        return ''
+    return str(node)